@@ -5,11 +5,13 @@ APP_VERSION = "0.1.5-alpha" # Incremented version
 
 # Target Python version for checks
 MIN_PYTHON_VERSION = (3, 8) 
+MIN_PYTHON_VERSION_PACKED = MIN_PYTHON_VERSION[0] * 1000 + MIN_PYTHON_VERSION[1]
 
 # URLs - Ensuring these are plain strings
 PYTHON_OFFICIAL_WEBSITE_URL = "https://www.python.org"
 PYTHON_FTP_BASE_URL = "https://www.python.org/ftp/python"
 PYTHON_INSTALLER_URL_WIN_FALLBACK = f"{PYTHON_FTP_BASE_URL}/3.13.3/python-3.13.3-amd64.exe"
+PYTHON_VERSION_API_URL = "https://endoflife.date/api/python.json"
 
 DEVKITPRO_UPDATER_URL = "https://github.com/devkitPro/installer/releases/download/v3.0.3/devkitProUpdater-3.0.3.exe"
 CODEWARRIOR_INSTALLER_INFO_URL = "YOUR_CW_INFO_OR_DOWNLOAD_PAGE_HERE" # Placeholder
@@ -20,9 +22,13 @@ DIR_NAME_GAME_SOURCES = "game_sources"
 DIR_NAME_MODULES = "modules"
 DIR_NAME_BUILD_OUTPUT = "build_output"
 DIR_NAME_COMPILERS_TOOLS = "tools" 
+DIR_NAME_CACHE = "cache"
+
+# How long a cached latest-Python-version lookup stays valid
+PYTHON_VERSION_CACHE_TTL_SECONDS = 24 * 60 * 60
 
 # Required pip packages
-PIP_PACKAGES = ["PyYAML>=5.1", "pyelftools>=0.27", "requests>=2.25.0", "beautifulsoup4>=4.9.0"] 
+PIP_PACKAGES = ("PyYAML>=5.1", "pyelftools>=0.27", "requests>=2.25.0", "beautifulsoup4>=4.9.0")
 
 # Environment Variables to check
 DEVKITPRO_ENV_VAR = "DEVKITPRO"
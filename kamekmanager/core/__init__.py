@@ -1,28 +1,54 @@
 # kamekmanager/core/__init__.py
-from .system_utils import (
-    check_admin_privileges,
-    get_user_data_directory,
-    run_command,
-    set_environment_variable,
-    get_environment_variable,
-    is_program_in_path,
-    add_directory_to_system_path,
-    download_file,
-    extract_zip,
-    prompt_user_for_confirmation
-)
+# Public helpers are resolved lazily (PEP 562), so importing one submodule does not
+# pull in the others and their dependencies.
+import importlib
 
-from .python_env import (
-    check_python_installation,
-    install_python_interactive, 
-    upgrade_python_interactive, 
-    ensure_python_in_path, 
-    check_and_install_pip_packages,
-    get_latest_python_download_url, 
-    update_pip 
-)
+_SUBMODULE_EXPORTS = {
+    "system_utils": (
+        "check_admin_privileges",
+        "get_user_data_directory",
+        "run_command",
+        "shell_execute",
+        "set_environment_variable",
+        "get_environment_variable",
+        "is_program_in_path",
+        "is_directory_in_path",
+        "add_directory_to_system_path",
+        "get_http_session",
+        "is_url_available",
+        "find_first_available_url",
+        "download_file",
+        "download_file_segmented",
+        "extract_zip",
+        "prompt_user_for_confirmation",
+    ),
+    "python_env": (
+        "check_python_installation",
+        "install_python_interactive",
+        "upgrade_python_interactive",
+        "ensure_python_in_path",
+        "check_and_install_pip_packages",
+        "get_latest_python_download_url",
+        "update_pip",
+        "invalidate_python_info_cache",
+    ),
+    "toolchain_setup": (
+        "check_devkitpro_installation",
+        "install_devkitpro_interactive",
+    ),
+}
 
-from .toolchain_setup import ( 
-    check_devkitpro_installation,
-    install_devkitpro_interactive
-)
\ No newline at end of file
+_LAZY_ATTRS = {name: module for module, names in _SUBMODULE_EXPORTS.items() for name in names}
+
+__all__ = list(_LAZY_ATTRS)
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
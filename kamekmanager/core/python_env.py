@@ -1,22 +1,47 @@
 # kamekmanager/core/python_env.py
 import sys
-import subprocess
-import importlib.util
 import pathlib 
 import os 
 import re 
-import tempfile 
 import shutil 
-from datetime import datetime 
+import functools
+import json
+import time
 
 from kamekmanager.core import system_utils 
 from kamekmanager.common import constants
 
 try:
-    import requests
-    REQUESTS_AVAILABLE = True
+    from packaging.requirements import Requirement, InvalidRequirement
+    from packaging.version import InvalidVersion
+    PACKAGING_AVAILABLE = True
 except ImportError:
-    REQUESTS_AVAILABLE = False
+    PACKAGING_AVAILABLE = False
+
+# Argument tails for `<python> -m pip ...` invocations.
+_PIP_LIST_JSON_ARGS = ("-m", "pip", "list", "--format=json", "--disable-pip-version-check")
+_PIP_FREEZE_ARGS = ("-m", "pip", "freeze")
+_PIP_INSTALL_ARGS = ("-m", "pip", "install", "--disable-pip-version-check", "--no-input")
+_PIP_UPGRADE_PIP_ARGS = ("-m", "pip", "install", "--upgrade", "pip")
+
+# Set once the "python in PATH is Python 2" side-check has run; its outcome cannot change within a run.
+_path_python_checked = False
+
+# How many invalid interpreter paths the upgrade flow accepts before giving up on package migration.
+_MAX_PATH_PROMPT_ATTEMPTS = 3
+
+# Isolated (-I) interpreter probe without site initialisation (-S); much cheaper than a full startup.
+_PY_VERSION_PROBE_ARGS = ("-I", "-S", "-c", "import sys; sys.stdout.write('%d.%d.%d' % sys.version_info[:3])")
+
+# Leading distribution name of a requirement spec, stopping at extras, specifiers or markers.
+_SPEC_NAME_RE = re.compile(r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)")
+_NAME_SEPARATOR_RE = re.compile(r"[-_.]+")
+_PY_VERSION_RE = re.compile(r"Python (\d+\.\d+\.\d+)", re.IGNORECASE)
+_VERSION_STR_RE = re.compile(r"(\d+\.\d+\.\d+)")
+_SAFE_FILENAME_RE = re.compile(r'[^\w\.-]')
+_WINDOWS_APPS_RE = re.compile(r"windowsapps", re.IGNORECASE)
+_URL_SCHEMES = ("http://", "https://")
+_INSTALLER_SUFFIXES = (".exe", ".pkg", ".dmg")
 
 def get_python_executable_info(python_exe_path_str: str) -> dict | None:
     """Gets version and path for a given Python executable."""
@@ -24,43 +49,197 @@ def get_python_executable_info(python_exe_path_str: str) -> dict | None:
         return None
     python_exe = pathlib.Path(python_exe_path_str)
     if not python_exe.is_file(): 
-        resolved_by_which = shutil.which(str(python_exe))
+        resolved_by_which = _which_python(str(python_exe))
         if resolved_by_which:
             python_exe = pathlib.Path(resolved_by_which)
         else:
             return None 
 
     try:
-        result = system_utils.run_command([str(python_exe), "--version"], capture_output=True, check_return_code=False)
-        if result and result.returncode == 0:
-            output = result.stdout.strip() + result.stderr.strip() 
-            match = re.search(r"Python (\d+\.\d+\.\d+)", output, re.IGNORECASE)
-            if match:
-                version_str = match.group(1)
-                version_tuple = tuple(map(int, version_str.split('.')))
-                is_windows_store_app = False
-                if os.name == 'nt':
-                    try:
-                        actual_path = python_exe.resolve()
-                        if "windowsapps" in str(actual_path).lower():
-                            is_windows_store_app = True
-                    except Exception: 
-                        pass 
-                return {
-                    "executable": str(python_exe.resolve()), 
-                    "version_str": version_str,
-                    "version_tuple": version_tuple,
-                    "is_windows_store_app": is_windows_store_app
-                }
+        # os.path.realpath + os.stat stay in C; Path.resolve() walks the components in Python.
+        resolved_exe = os.path.realpath(python_exe)
+        exe_stat = os.stat(resolved_exe)
+    except OSError:
+        # e.g. Windows app execution aliases cannot always be stat'ed; probe without caching.
+        return _probe_python_executable(python_exe)
+    current_python_info = _get_current_python_info()
+    if resolved_exe == current_python_info["executable"]:
+        return current_python_info
+    return _get_python_executable_info_cached(resolved_exe, exe_stat.st_mtime_ns, exe_stat.st_size)
+
+@functools.lru_cache(maxsize=64)
+def _get_python_executable_info_cached(resolved_exe_str: str, mtime_ns: int, size: int) -> dict | None:
+    """
+    Cached probe keyed on the resolved path plus mtime/size, so a reinstalled interpreter is re-probed.
+    Results are also persisted to disk so later CLI invocations can skip the subprocess.
+    """
+    persistent_cache = _load_python_info_cache()
+    entry = persistent_cache.get(resolved_exe_str)
+    if entry and entry.get("mtime_ns") == mtime_ns and entry.get("size") == size and entry.get("info"):
+        info = dict(entry["info"])
+        info["version_tuple"] = tuple(info["version_tuple"])
+        return info
+
+    info = _probe_python_executable(pathlib.Path(resolved_exe_str))
+    if info:
+        persistent_cache[resolved_exe_str] = {"mtime_ns": mtime_ns, "size": size, "info": info}
+        _write_json_cache(_get_cache_file_path("python_info.json"), persistent_cache)
+    return info
+
+@functools.lru_cache(maxsize=1)
+def _load_python_info_cache() -> dict:
+    """Loads the on-disk {resolved_path: {mtime_ns, size, info}} interpreter cache once per process."""
+    return _read_json_cache(_get_cache_file_path("python_info.json")) or {}
+
+def _get_cache_file_path(file_name: str) -> pathlib.Path:
+    return system_utils.get_user_data_directory() / constants.DIR_NAME_CACHE / file_name
+
+def _read_json_cache(cache_path: pathlib.Path) -> dict | None:
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else None
+    except (OSError, ValueError):
+        return None
+
+def _write_json_cache(cache_path: pathlib.Path, cache: dict) -> None:
+    """Writes the cache atomically so a concurrent reader never sees a partial file."""
+    tmp_path = cache_path.with_suffix(".tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"Note: Could not write cache file {cache_path}: {e}", file=sys.stderr)
+
+def invalidate_python_info_cache() -> None:
+    """Drops cached interpreter info (in-memory and on disk), e.g. after installing or removing a Python."""
+    _get_python_executable_info_cached.cache_clear()
+    _load_python_info_cache.cache_clear()
+    try:
+        _get_cache_file_path("python_info.json").unlink(missing_ok=True)
+    except OSError as e:
+        print(f"Note: Could not remove interpreter info cache: {e}", file=sys.stderr)
+
+def _read_python_version(python_exe: pathlib.Path) -> str | None:
+    """
+    Asks an interpreter for its X.Y.Z version. Tries a minimal isolated probe first (-I -S skips site
+    initialisation), then falls back to `--version` for interpreters that reject -I, such as Python 2.
+    """
+    # The payload is a few ASCII bytes, so capture raw bytes and decode once instead of
+    # letting subprocess run a locale decode over each stream.
+    result = system_utils.run_command([str(python_exe), *_PY_VERSION_PROBE_ARGS], capture_output=True, check_return_code=False, text=False)
+    if result and result.returncode == 0:
+        version_str = _parse_version_str((result.stdout or b"").decode("ascii", errors="replace").strip())
+        if version_str:
+            return version_str
+
+    result = system_utils.run_command([str(python_exe), "--version"], capture_output=True, check_return_code=False, text=False)
+    if result and result.returncode == 0:
+        # Python 3 reports its version on stdout, Python 2 on stderr; parse each stream on its own.
+        for output in (result.stdout, result.stderr):
+            version_str = _parse_version_output((output or b"").decode("ascii", errors="replace"))
+            if version_str:
+                return version_str
+    return None
+
+def _parse_version_str(text: str) -> str | None:
+    """Returns text if it is exactly 'X.Y.Z' with numeric parts, else None. Avoids the regex engine."""
+    parts = text.split('.')
+    if len(parts) == 3 and all(part.isdecimal() for part in parts):
+        return text
+    return None
+
+def _parse_version_output(output: str) -> str | None:
+    """Parses `python --version` output ('Python X.Y.Z'); falls back to a regex for unusual formats."""
+    output = output.strip()
+    if output[:7].lower() == "python ":
+        version_str = _parse_version_str(output[7:].split(None, 1)[0] if output[7:] else "")
+        if version_str:
+            return version_str
+    match = _PY_VERSION_RE.search(output)
+    return match.group(1) if match else None
+
+def _probe_python_executable(python_exe: pathlib.Path) -> dict | None:
+    """Runs the interpreter to read its version and builds the interpreter info dict."""
+    try:
+        version_str = _read_python_version(python_exe)
+        if version_str:
+            version_tuple = tuple(map(int, version_str.split('.')))
+            actual_path = os.path.realpath(python_exe)
+            is_windows_store_app = _is_windows_store_path(actual_path)
+            return {
+                "executable": actual_path, 
+                "version_str": version_str,
+                "version_tuple": version_tuple,
+                "is_windows_store_app": is_windows_store_app
+            }
         return None
     except Exception as e:
         print(f"Error getting info for Python executable {python_exe}: {e}", file=sys.stderr)
         return None
 
+def _is_windows_store_path(path_str: str) -> bool:
+    """MS Store Pythons live under ...\\WindowsApps; scanned case-insensitively without lowercasing a copy."""
+    return os.name == 'nt' and _WINDOWS_APPS_RE.search(path_str) is not None
+
+@functools.lru_cache(maxsize=1)
+def _get_current_python_info() -> dict:
+    """Builds the interpreter info dict for the running Python without spawning a subprocess."""
+    executable = os.path.realpath(sys.executable)
+    return {
+        "executable": executable,
+        "version_str": f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
+        "version_tuple": tuple(sys.version_info[:3]),
+        "is_windows_store_app": _is_windows_store_path(executable)
+    }
+
+@functools.lru_cache(maxsize=256)
+def _realpath(path: str | os.PathLike) -> str:
+    """Resolved, case-normalized path for equality checks; cached since the same paths are compared repeatedly."""
+    return os.path.normcase(os.path.realpath(path))
+
+def _is_current_python(python_exe: str | os.PathLike) -> bool:
+    return _realpath(python_exe) == _realpath(sys.executable)
+
+def _is_running_interpreter(python_exe_path_str: str) -> bool:
+    """
+    True only for the running interpreter's own path, compared without resolving symlinks:
+    a venv's python links to its base interpreter, so a realpath match may be a different prefix.
+    """
+    return os.path.normcase(os.path.abspath(python_exe_path_str)) == os.path.normcase(os.path.abspath(sys.executable))
+
+@functools.lru_cache(maxsize=None)
+def _which_python(command_name: str) -> str | None:
+    """
+    shutil.which() for Python commands, cached since walking PATH is slow. Cleared once a new
+    Python has been installed, as the installer may drop executables into existing PATH dirs.
+    """
+    return shutil.which(command_name)
+
+def _pack_version(version_tuple: tuple) -> int:
+    """Packs a (major, minor, ...) tuple into a single comparable int, e.g. (3, 8) -> 3008."""
+    return version_tuple[0] * 1000 + (version_tuple[1] if len(version_tuple) > 1 else 0)
+
+def _looks_like_python2(python_exe: pathlib.Path) -> bool:
+    """
+    Filesystem-only guess at whether an executable is Python 2, without running it.
+    POSIX installs name the real binary 'python2.X'; Windows installs ship a 'python2X.dll' next to python.exe.
+    """
+    if python_exe.name.lower().startswith("python2"):
+        return True
+    if os.name == 'nt':
+        try:
+            return any(python_exe.parent.glob("python2*.dll"))
+        except OSError:
+            return False
+    return False
+
 def check_python_installation(min_version: tuple = constants.MIN_PYTHON_VERSION, specific_exe: str | None = None) -> dict | None:
     python_to_check = specific_exe if specific_exe else sys.executable
     if not python_to_check:
-        python_in_path = shutil.which("python3") or shutil.which("python")
+        python_in_path = _which_python("python3") or _which_python("python")
         if not python_in_path:
             print("No Python executable specified or found (sys.executable is empty and none in PATH).", file=sys.stderr)
             return None
@@ -75,57 +254,112 @@ def check_python_installation(min_version: tuple = constants.MIN_PYTHON_VERSION,
     if info["version_tuple"][0] == 2:
         print(f"Warning: Python at {info['executable']} is Python 2 ({info['version_str']}). This tool requires Python 3.", file=sys.stderr)
         return None 
-    if info["version_tuple"] < min_version:
+    min_version_packed = constants.MIN_PYTHON_VERSION_PACKED if min_version == constants.MIN_PYTHON_VERSION else _pack_version(min_version)
+    if _pack_version(info["version_tuple"]) < min_version_packed:
         print(f"Python version {info['version_str']} at {info['executable']} is older than required {min_version[0]}.{min_version[1]}+.", file=sys.stderr)
         return None
     if info["is_windows_store_app"]:
-        print(f"Warning: Python at {info['executable']} appears to be a Microsoft Store version.")
-        print("MS Store Python has limitations and may not work correctly with all development tools.")
-        print("It's recommended to uninstall it and install Python from python.org.")
+        print(f"Warning: Python at {info['executable']} appears to be a Microsoft Store version.\n"
+              "MS Store Python has limitations and may not work correctly with all development tools.\n"
+              "It's recommended to uninstall it and install Python from python.org.")
     
-    if not specific_exe: 
-        python_cmd_in_path = shutil.which("python")
+    global _path_python_checked
+    if not specific_exe and not _path_python_checked: 
+        _path_python_checked = True
+        python_cmd_in_path = _which_python("python")
         if python_cmd_in_path:
-            current_interpreter_resolved_path = pathlib.Path(sys.executable).resolve()
-            python_cmd_resolved_path = pathlib.Path(python_cmd_in_path).resolve()
+            python_cmd_resolved_path = pathlib.Path(os.path.realpath(python_cmd_in_path))
+            if not _is_current_python(python_cmd_in_path) and _looks_like_python2(python_cmd_resolved_path):
+                print(f"Warning: The 'python' command in your PATH points to Python 2 ({python_cmd_resolved_path}).", file=sys.stderr)
+    # The interpreter info caches hand out shared dicts; give callers their own copy.
+    return dict(info)
 
-            if current_interpreter_resolved_path != python_cmd_resolved_path:
-                python_cmd_info = get_python_executable_info(python_cmd_in_path)
-                if python_cmd_info and python_cmd_info["version_tuple"][0] == 2:
-                    print(f"Warning: The 'python' command in your PATH points to Python 2 ({python_cmd_info['version_str']} at {python_cmd_info['executable']}).", file=sys.stderr)
-    return info
+def _read_python_version_cache() -> dict | None:
+    cache = _read_json_cache(_get_cache_file_path("python_version.json"))
+    return cache if cache and cache.get("latest") else None
 
+@functools.lru_cache(maxsize=1)
 def _get_latest_python_version_from_api() -> str | None:
-    """Helper to get the latest stable Python version string from endoflife.date API."""
-    if not REQUESTS_AVAILABLE:
+    """
+    Gets the latest stable Python version string, using an on-disk cache that is refreshed
+    from the endoflife.date API once it is older than PYTHON_VERSION_CACHE_TTL_SECONDS.
+    A stale cache entry is still used if the API cannot be reached.
+    """
+    cache = _read_python_version_cache()
+    if cache and time.time() - cache.get("ts", 0) < constants.PYTHON_VERSION_CACHE_TTL_SECONDS:
+        print(f"Using cached latest Python version: {cache['latest']}")
+        return cache["latest"]
+
+    fetched = _fetch_latest_python_version_from_api(cache)
+    if fetched:
+        _write_json_cache(_get_cache_file_path("python_version.json"), {**fetched, "ts": time.time()})
+        return fetched["latest"]
+    if cache:
+        print(f"Warning: Using stale cached latest Python version: {cache['latest']}", file=sys.stderr)
+        return cache["latest"]
+    return None
+
+@functools.lru_cache(maxsize=1)
+def _get_requests():
+    """Imports 'requests' on first use; it pulls in urllib3/ssl and is only needed for network lookups."""
+    try:
+        import requests
+        return requests
+    except ImportError:
+        return None
+
+def _parse_latest_python_version(data) -> str | None:
+    """Picks the latest version of the newest non-EOL cycle out of the endoflife.date payload."""
+    if data and isinstance(data, list) and len(data) > 0:
+        for cycle_info in data: 
+            eol_status = cycle_info.get("eol")
+            if isinstance(eol_status, bool) and eol_status is False:
+                if "latest" in cycle_info and cycle_info["latest"]:
+                    latest_version_str = cycle_info["latest"]
+                    print(f"Latest stable (non-EOL cycle) Python version from API: {latest_version_str}")
+                    return latest_version_str
+        
+        if data[0] and "latest" in data[0] and data[0]["latest"]:
+            print("Warning: Could not find a definitively non-EOL Python cycle with a 'latest' version. Using the newest listed cycle's 'latest'.", file=sys.stderr)
+            return data[0]["latest"]
+            
+    print("Could not parse latest Python version from API response structure.", file=sys.stderr)
+    return None
+
+def _fetch_latest_python_version_from_api(cache: dict | None = None) -> dict | None:
+    """
+    Helper to get the latest stable Python version from endoflife.date API.
+    Sends the cached ETag/Last-Modified validators so an unchanged payload costs only a 304.
+    Returns a cache entry {"latest", "etag", "last_modified"} or None on failure.
+    """
+    requests = _get_requests()
+    if requests is None:
         print("Library 'requests' is required to fetch latest Python version from API.", file=sys.stderr)
         print("Please install it: pip install requests")
         return None
     try:
-        api_url = "https://endoflife.date/api/python.json" 
+        api_url = constants.PYTHON_VERSION_API_URL
         print(f"Fetching latest Python version info from: {api_url}")
-        headers = {'User-Agent': f'{constants.APP_NAME}/{constants.APP_VERSION}'}
-        response = requests.get(api_url, timeout=10, headers=headers)
+        headers = {}
+        if cache:
+            if cache.get("etag"):
+                headers['If-None-Match'] = cache["etag"]
+            if cache.get("last_modified"):
+                headers['If-Modified-Since'] = cache["last_modified"]
+        response = system_utils.get_http_session().get(api_url, timeout=10, headers=headers)
+        if response.status_code == 304 and cache:
+            print(f"Latest Python version unchanged since last check: {cache['latest']}")
+            return {"latest": cache["latest"], "etag": cache.get("etag"), "last_modified": cache.get("last_modified")}
         response.raise_for_status()
-        data = response.json()
-        
-        if data and isinstance(data, list) and len(data) > 0:
-            latest_cycle_info = None
-            for cycle_info in data: 
-                eol_status = cycle_info.get("eol")
-                if isinstance(eol_status, bool) and eol_status is False:
-                    if "latest" in cycle_info and cycle_info["latest"]:
-                        latest_version_str = cycle_info["latest"]
-                        print(f"Latest stable (non-EOL cycle) Python version from API: {latest_version_str}")
-                        return latest_version_str
-            
-            if data[0] and "latest" in data[0] and data[0]["latest"]:
-                print("Warning: Could not find a definitively non-EOL Python cycle with a 'latest' version. Using the newest listed cycle's 'latest'.", file=sys.stderr)
-                latest_version_str = data[0]["latest"]
-                return latest_version_str
-                
-        print("Could not parse latest Python version from API response structure.", file=sys.stderr)
-        return None
+
+        latest_version_str = _parse_latest_python_version(response.json())
+        if not latest_version_str:
+            return None
+        return {
+            "latest": latest_version_str,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified")
+        }
     except requests.exceptions.RequestException as e:
         print(f"Error fetching latest Python version from API ({api_url}): {e}", file=sys.stderr)
         return None
@@ -133,6 +367,25 @@ def _get_latest_python_version_from_api() -> str | None:
         print(f"Unexpected error processing API response for Python version: {e}", file=sys.stderr)
         return None
 
+def _macos_installer_filenames(version_str: str, version_tuple: tuple) -> list[str]:
+    # Installer naming changed over time; candidates are in order of preference.
+    if version_tuple < (3, 9):
+        return [f"python-{version_str}-macosx10.9.pkg", f"python-{version_str}-macos10.9.pkg"]
+    return [f"python-{version_str}-macos11.pkg", f"python-{version_str}-macosx10.9.pkg"]
+
+# os_filter -> builder of candidate installer filenames for (version_str, version_tuple)
+_OS_FILENAME_BUILDERS = {
+    "win64": lambda version_str, version_tuple: [f"python-{version_str}-amd64.exe"],
+    "win32": lambda version_str, version_tuple: [f"python-{version_str}.exe"],
+    "macos": _macos_installer_filenames,
+}
+
+def _fallback_installer_url(os_filter: str, version_str_override: str | None) -> str | None:
+    # The fallback is a fixed 64-bit Windows build: only a stand-in for "latest win64".
+    if version_str_override or os_filter != "win64":
+        return None
+    return constants.PYTHON_INSTALLER_URL_WIN_FALLBACK
+
 def get_latest_python_download_url(os_filter="win64", version_str_override: str | None = None) -> str | None:
     """
     Attempts to find the download URL for the latest (or specified) stable Python installer.
@@ -144,41 +397,36 @@ def get_latest_python_download_url(os_filter="win64", version_str_override: str
 
     if target_version_str:
         base_ftp_url = constants.PYTHON_FTP_BASE_URL 
-        filename = ""
-        match = re.fullmatch(r"(\d+\.\d+\.\d+)", target_version_str)
+        match = _VERSION_STR_RE.fullmatch(target_version_str)
         if not match:
             print(f"Invalid version string format: {target_version_str}. Expected X.Y.Z.", file=sys.stderr)
-            return constants.PYTHON_INSTALLER_URL_WIN_FALLBACK
+            return _fallback_installer_url(os_filter, version_str_override)
         
         clean_version_str = match.group(1)
 
-        if os_filter == "win64":
-            filename = f"python-{clean_version_str}-amd64.exe"
-        elif os_filter == "win32":
-            filename = f"python-{clean_version_str}.exe" 
-        elif os_filter == "macos":
-            v_tuple = tuple(map(int, clean_version_str.split('.')))
-            macos_ver_suffix = "macos11" 
-            if v_tuple < (3, 9): 
-                macos_ver_suffix = "macos10.9" 
-            filename = f"python-{clean_version_str}-{macos_ver_suffix}.pkg"
-        else:
+        filename_builder = _OS_FILENAME_BUILDERS.get(os_filter)
+        if not filename_builder:
             print(f"Unsupported OS filter for direct FTP URL: {os_filter}", file=sys.stderr)
-            return constants.PYTHON_INSTALLER_URL_WIN_FALLBACK
-
-        if filename:
-            direct_url = f"{base_ftp_url}/{clean_version_str}/{filename}"
-            print(f"Constructed download URL: {direct_url}")
-            return direct_url
+            return _fallback_installer_url(os_filter, version_str_override)
+        filenames = filename_builder(clean_version_str, tuple(map(int, clean_version_str.split('.'))))
+
+        candidate_urls = [f"{base_ftp_url}/{clean_version_str}/{filename}" for filename in filenames]
+        direct_url = system_utils.find_first_available_url(candidate_urls)
+        if not direct_url:
+            # Never substitute another version or OS here; the download itself reports a missing file.
+            direct_url = candidate_urls[0]
+            print(f"Warning: Could not verify that an installer exists at {direct_url}.", file=sys.stderr)
+        print(f"Constructed download URL: {direct_url}")
+        return direct_url
 
     print("Could not determine Python version for download URL construction.", file=sys.stderr)
-    return constants.PYTHON_INSTALLER_URL_WIN_FALLBACK
+    return _fallback_installer_url(os_filter, version_str_override)
 
 def install_python_interactive(version_or_url: str, download_dir: pathlib.Path) -> bool:
     installer_url = None
     if version_or_url.lower() == "latest":
         installer_url = get_latest_python_download_url() 
-    elif version_or_url.startswith("http://") or version_or_url.startswith("https://"):
+    elif version_or_url.startswith(_URL_SCHEMES):
         installer_url = version_or_url
     else: 
         print(f"Attempting to find installer URL for Python version: {version_or_url}")
@@ -189,35 +437,42 @@ def install_python_interactive(version_or_url: str, download_dir: pathlib.Path)
         return False
 
     installer_name = installer_url.split('/')[-1]
-    if not (installer_name.endswith((".exe", ".pkg", ".dmg"))): 
+    if not installer_name.endswith(_INSTALLER_SUFFIXES): 
         print(f"Warning: Download URL does not appear to point to a standard installer file: {installer_name}", file=sys.stderr)
         original_extension = pathlib.Path(installer_name).suffix
-        safe_version_or_url = re.sub(r'[^\w\.-]', '_', version_or_url)
+        safe_version_or_url = _SAFE_FILENAME_RE.sub('_', version_or_url)
         installer_name = f"python_installer_{safe_version_or_url}{original_extension if original_extension and len(original_extension) <=4 else '.exe'}"
         print(f"Using generic filename: {installer_name}")
 
     installer_path = download_dir / installer_name
 
-    if not system_utils.download_file(installer_url, installer_path):
+    if not system_utils.download_file_segmented(installer_url, installer_path):
         print(f"Failed to download Python installer from {installer_url}", file=sys.stderr)
         return False
 
     print(f"Python installer downloaded to: {installer_path}")
-    print("Please run the installer manually.")
-    print("IMPORTANT: During installation, ensure you check options like:")
-    print("  - 'Add Python X.Y to PATH'")
-    print("  - 'Install for all users' (if desired, requires admin for installer too)")
-    print("  - Consider customizing the installation path if needed.")
+    print("Please run the installer manually.\n"
+          "IMPORTANT: During installation, ensure you check options like:\n"
+          "  - 'Add Python X.Y to PATH'\n"
+          "  - 'Install for all users' (if desired, requires admin for installer too)\n"
+          "  - Consider customizing the installation path if needed.")
 
     try:
         print(f"Attempting to launch installer: {str(installer_path)}...")
         if os.name == 'nt':
-            os.startfile(installer_path) 
-            print("Installer launched (os.startfile). Please follow its instructions.")
+            launched = system_utils.shell_execute(installer_path)
+            if launched is None:
+                os.startfile(installer_path) 
+                print("Installer launched (os.startfile). Please follow its instructions.")
+            elif launched:
+                print("Installer launched. Please follow its instructions.")
+            else:
+                # ShellExecuteW already ran (e.g. UAC was declined); launching again would prompt twice.
+                print(f"Please navigate to '{installer_path.parent}' and run '{installer_path.name}' manually.")
         elif os.name == 'posix': 
             if installer_path.suffix == '.pkg':
                 print(f"Attempting to open installer with default application: {installer_path}")
-                system_utils.run_command(['open', str(installer_path)], check_return_code=False)
+                system_utils.run_command(['open', str(installer_path)], check_return_code=False, discard_output=True)
             else:
                 print(f"Please make the installer executable (chmod +x {installer_path}) and run it manually.")
         else:
@@ -230,14 +485,32 @@ def install_python_interactive(version_or_url: str, download_dir: pathlib.Path)
     print("\nAfter installation, you might need to restart your terminal or KamekManager.")
     return True
 
-def update_pip(python_exe_path_str: str) -> bool:
+def _resolve_python_exe_cheaply(python_exe_path_str: str) -> str | None:
+    """
+    Returns the interpreter path to run. An absolute path to an executable file is used as-is,
+    since a bogus interpreter will simply fail the pip call; anything else is probed.
+    Symlinks are not resolved: a venv's python links to its base interpreter, which is a different prefix.
+    """
+    if python_exe_path_str and os.path.isabs(python_exe_path_str) and os.path.isfile(python_exe_path_str) \
+            and os.access(python_exe_path_str, os.X_OK):
+        return os.path.abspath(python_exe_path_str)
     python_info = get_python_executable_info(python_exe_path_str)
-    if not python_info:
+    return python_info['executable'] if python_info else None
+
+_PERMISSION_ERROR_RE = re.compile(r"permission denied|environmenterror|access is denied", re.IGNORECASE)
+
+def _looks_like_permission_error(*texts: str | None) -> bool:
+    """Scans each output stream for permission-related failures in one pass, without copying or lowercasing it."""
+    return any(text and _PERMISSION_ERROR_RE.search(text) for text in texts)
+
+def update_pip(python_exe_path_str: str) -> bool:
+    python_exe = _resolve_python_exe_cheaply(python_exe_path_str)
+    if not python_exe:
         print(f"Cannot update pip: Invalid Python executable path {python_exe_path_str}", file=sys.stderr)
         return False
     
-    print(f"Attempting to upgrade pip for Python at {python_info['executable']}...")
-    pip_upgrade_cmd = [python_info['executable'], "-m", "pip", "install", "--upgrade", "pip"]
+    print(f"Attempting to upgrade pip for Python at {python_exe}...")
+    pip_upgrade_cmd = [python_exe, *_PIP_UPGRADE_PIP_ARGS]
     result = system_utils.run_command(pip_upgrade_cmd, display_output_live=True, check_return_code=False)
     
     if result and result.returncode == 0:
@@ -245,10 +518,10 @@ def update_pip(python_exe_path_str: str) -> bool:
         return True
     else:
         print("Failed to upgrade pip.", file=sys.stderr)
-        stderr_output = ((result.stdout or "") + (result.stderr or "")).lower() 
-        if result and result.returncode !=0 and ("permission denied" in stderr_output or "environmenterror" in stderr_output or "access is denied" in stderr_output):
+        # The live run captures its merged output, so pip's permission errors can be recognised here.
+        if result and result.returncode != 0 and _looks_like_permission_error(result.stdout, result.stderr):
              print("Attempting pip upgrade with --user flag due to potential permission issues...")
-             pip_upgrade_cmd_user = [python_info['executable'], "-m", "pip", "install", "--upgrade", "pip", "--user"]
+             pip_upgrade_cmd_user = [python_exe, *_PIP_UPGRADE_PIP_ARGS, "--user"]
              result_user = system_utils.run_command(pip_upgrade_cmd_user, display_output_live=True, check_return_code=True)
              if result_user and result_user.returncode == 0:
                   print("pip upgraded successfully with --user flag.")
@@ -257,7 +530,98 @@ def update_pip(python_exe_path_str: str) -> bool:
                   print("Failed to upgrade pip even with --user flag.", file=sys.stderr)
         return False
 
-def check_and_install_pip_packages(python_exe_path_str: str, packages: list[str]) -> bool:
+def _normalize_package_name(name: str) -> str:
+    """Normalizes a distribution name per PEP 503 so lookups are case/separator insensitive."""
+    return _NAME_SEPARATOR_RE.sub("-", name).lower()
+
+def _get_package_name(package_spec: str) -> str:
+    """Extracts the distribution name from a requirement spec such as 'requests[socks]>=2.25'."""
+    match = _SPEC_NAME_RE.match(package_spec)
+    return match.group(1) if match else package_spec.strip()
+
+def _get_installed_packages(python_exe: str, package_names: list[str], in_process: bool) -> dict[str, str]:
+    """
+    Returns a {normalized_name: version} mapping covering the requested distributions that are installed.
+    With in_process set (python_exe is the running interpreter), this queries importlib.metadata.version();
+    other interpreters are queried with a single `pip list --format=json` snapshot.
+    """
+    installed = {}
+    if in_process:
+        import importlib.metadata
+        for package_name in package_names:
+            try:
+                installed[_normalize_package_name(package_name)] = importlib.metadata.version(package_name)
+            except importlib.metadata.PackageNotFoundError:
+                pass
+        return installed
+
+    pip_list_cmd = [python_exe, *_PIP_LIST_JSON_ARGS]
+    result = system_utils.run_command(pip_list_cmd, capture_output=True, check_return_code=False)
+    if not result or result.returncode != 0 or not result.stdout:
+        return installed
+    try:
+        pip_list = json.loads(result.stdout)
+    except ValueError:
+        print(f"Could not parse 'pip list' output for {python_exe}.", file=sys.stderr)
+        return installed
+    for entry in pip_list:
+        if entry.get("name") and entry.get("version"):
+            installed[_normalize_package_name(entry["name"])] = entry["version"]
+    return installed
+
+def _is_spec_satisfied(package_spec: str, installed_version: str) -> bool:
+    """Checks an installed version against a requirement spec. Presence alone counts if 'packaging' is unavailable."""
+    if not PACKAGING_AVAILABLE:
+        return True
+    try:
+        return Requirement(package_spec).specifier.contains(installed_version, prereleases=True)
+    except (InvalidRequirement, InvalidVersion):
+        return True
+
+def _get_pip_marker_path(packages: list[str] | tuple[str, ...]) -> pathlib.Path:
+    """
+    Marker file recording that the given package specs were satisfied for the running interpreter.
+    Keyed on sys.prefix and the unresolved sys.executable, so venvs sharing a base interpreter don't collide.
+    """
+    import hashlib
+    key = hashlib.sha1("\0".join([repr(sorted(packages)), sys.prefix, sys.executable]).encode("utf-8")).hexdigest()[:16]
+    return system_utils.get_user_data_directory() / f".pip_ok_{key}"
+
+def _is_pip_marker_fresh(marker_path: pathlib.Path) -> bool:
+    """
+    True if the marker is newer than the current interpreter's site-packages directories, including
+    the user site that pip falls back to when site-packages is not writable.
+    """
+    import site
+    import sysconfig
+    try:
+        marker_mtime = marker_path.stat().st_mtime
+        site_dirs = {sysconfig.get_paths()["purelib"], sysconfig.get_paths()["platlib"]}
+        if site.ENABLE_USER_SITE:
+            site_dirs.add(site.getusersitepackages())
+        return all(marker_mtime > os.stat(site_dir).st_mtime for site_dir in site_dirs if os.path.isdir(site_dir))
+    except OSError:
+        return False
+
+def _touch_pip_marker_if_satisfied(marker_path: pathlib.Path, packages: list[str] | tuple[str, ...],
+                                    package_names: list[str]) -> None:
+    """After an install, re-checks the specs in-process and only records the marker if they now all pass."""
+    import importlib
+    importlib.invalidate_caches()
+    installed = _get_installed_packages(sys.executable, package_names, in_process=True)
+    for package_spec, package_name in zip(packages, package_names):
+        installed_version = installed.get(_normalize_package_name(package_name))
+        if installed_version is None or not _is_spec_satisfied(package_spec, installed_version):
+            return
+    _touch_pip_marker(marker_path)
+
+def _touch_pip_marker(marker_path: pathlib.Path) -> None:
+    try:
+        marker_path.touch()
+    except OSError as e:
+        print(f"Note: Could not write pip package marker {marker_path}: {e}", file=sys.stderr)
+
+def check_and_install_pip_packages(python_exe_path_str: str, packages: list[str] | tuple[str, ...]) -> bool:
     python_info = get_python_executable_info(python_exe_path_str)
     if not python_info:
         print(f"Cannot manage pip packages: Invalid Python executable path {python_exe_path_str}", file=sys.stderr)
@@ -267,24 +631,108 @@ def check_and_install_pip_packages(python_exe_path_str: str, packages: list[str]
         print(f"No pip packages specified to check or install for {python_exe}.")
         return True
 
-    all_successful = True
+    # Check in-process only for the running interpreter itself, and then run pip with the same
+    # unresolved sys.executable so the check and the install see the same (possibly venv) prefix.
+    in_process = _is_running_interpreter(python_exe_path_str)
+    if in_process:
+        python_exe = sys.executable
+    marker_path = _get_pip_marker_path(packages) if in_process else None
+    if marker_path and _is_pip_marker_fresh(marker_path):
+        print(f"All requested pip packages were already verified for {python_exe}.")
+        return True
+
     print(f"Managing pip packages for Python at: {python_exe}")
-    for package_spec in packages:
-        package_name = package_spec.split('==')[0].split('>=')[0].split('<=')[0].split('!=')[0].split('~=')[0]
-        pip_show_cmd = [python_exe, "-m", "pip", "show", package_name]
-        result = system_utils.run_command(pip_show_cmd, capture_output=True, check_return_code=False)
-        if result and result.returncode == 0:
+    package_names = [_get_package_name(package_spec) for package_spec in packages]
+    installed = _get_installed_packages(python_exe, package_names, in_process)
+
+    missing_specs = []
+    for package_spec, package_name in zip(packages, package_names):
+        installed_version = installed.get(_normalize_package_name(package_name))
+        if installed_version is not None and _is_spec_satisfied(package_spec, installed_version):
             print(f"Package '{package_name}' (from spec '{package_spec}') is already installed for {python_exe}.")
+        elif installed_version is not None:
+            print(f"Package '{package_name}' {installed_version} does not satisfy spec '{package_spec}' for {python_exe}. Will upgrade.")
+            missing_specs.append(package_spec)
         else:
-            print(f"Package '{package_name}' (from spec '{package_spec}') not found for {python_exe}. Attempting to install...")
-            pip_install_cmd = [python_exe, "-m", "pip", "install", package_spec]
-            install_result = system_utils.run_command(pip_install_cmd, display_output_live=True, check_return_code=True)
-            if install_result and install_result.returncode == 0:
-                print(f"Successfully installed '{package_spec}' for {python_exe}.")
-            else:
-                print(f"Failed to install '{package_spec}' for {python_exe}.", file=sys.stderr)
-                all_successful = False
-    return all_successful
+            print(f"Package '{package_name}' (from spec '{package_spec}') not found for {python_exe}. Will install.")
+            missing_specs.append(package_spec)
+
+    if not missing_specs:
+        if marker_path:
+            _touch_pip_marker(marker_path)
+        return True
+
+    print(f"Installing {', '.join(missing_specs)} for {python_exe}...")
+    pip_install_cmd = [python_exe, *_PIP_INSTALL_ARGS, *missing_specs]
+    install_result = system_utils.run_command(pip_install_cmd, display_output_live=True, check_return_code=True)
+    if install_result and install_result.returncode == 0:
+        print(f"Successfully installed {', '.join(missing_specs)} for {python_exe}.")
+        if marker_path:
+            _touch_pip_marker_if_satisfied(marker_path, packages, package_names)
+        return True
+    if len(missing_specs) == 1:
+        print(f"Failed to install {missing_specs[0]} for {python_exe}.", file=sys.stderr)
+        return False
+
+    # One bad spec fails the whole batch; retry individually so the failure is attributed correctly.
+    print("Batch install failed. Retrying packages one at a time...", file=sys.stderr)
+    failed_specs = []
+    for package_spec in missing_specs:
+        result = system_utils.run_command([python_exe, *_PIP_INSTALL_ARGS, package_spec], display_output_live=True, check_return_code=True)
+        if not (result and result.returncode == 0):
+            failed_specs.append(package_spec)
+    if failed_specs:
+        print(f"Failed to install {', '.join(failed_specs)} for {python_exe}.", file=sys.stderr)
+        return False
+    print(f"Successfully installed {', '.join(missing_specs)} for {python_exe}.")
+    if marker_path:
+        _touch_pip_marker_if_satisfied(marker_path, packages, package_names)
+    return True
+
+def _discard_requirements_file(requirements_path: pathlib.Path | None) -> None:
+    """Deletes a requirements backup file if present. Returns None so callers can clear their reference."""
+    if requirements_path:
+        try:
+            requirements_path.unlink(missing_ok=True)
+        except OSError as e:
+            print(f"Note: Could not delete temporary requirements file {requirements_path}: {e}", file=sys.stderr)
+    return None
+
+def _new_python_search_roots() -> list[tuple[pathlib.Path, str]]:
+    """Returns (directory, interpreter path inside each install dir) pairs where installers usually put Python."""
+    if os.name == 'nt':
+        roots = [os.environ.get("SystemDrive", "C:") + "\\", os.environ.get("ProgramFiles")]
+        if os.environ.get("LOCALAPPDATA"):
+            roots.append(os.path.join(os.environ["LOCALAPPDATA"], "Programs", "Python"))
+        return [(pathlib.Path(root), "python.exe") for root in roots if root]
+    if sys.platform == 'darwin':
+        return [(pathlib.Path("/Library/Frameworks/Python.framework/Versions"), "bin/python3")]
+    return []
+
+def _find_new_python_installs(since: float) -> list[pathlib.Path]:
+    """
+    Lists interpreters in the usual install locations whose install directory changed after `since`,
+    newest first. Uses os.scandir so each candidate directory costs no extra stat call.
+    """
+    found = []
+    for root, exe_rel_path in _new_python_search_roots():
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    name = entry.name.lower()
+                    if not (name.startswith("python3") or name[:1] == "3"):
+                        continue
+                    try:
+                        if not entry.is_dir() or entry.stat().st_mtime <= since:
+                            continue
+                        exe_path = pathlib.Path(entry.path, exe_rel_path)
+                        if exe_path.is_file():
+                            found.append((entry.stat().st_mtime, exe_path))
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return [exe_path for _, exe_path in sorted(found, reverse=True)]
 
 def upgrade_python_interactive(old_python_exe_str: str, download_dir: pathlib.Path) -> bool:
     print(f"--- Starting Python Upgrade Process for {old_python_exe_str} ---")
@@ -300,38 +748,61 @@ def upgrade_python_interactive(old_python_exe_str: str, download_dir: pathlib.Pa
             return False
 
     print("\nStep 1: Backing up list of installed packages from the old Python...")
-    requirements_content = None
-    pip_freeze_cmd = [old_python_exe, "-m", "pip", "freeze"]
-    freeze_result = system_utils.run_command(pip_freeze_cmd, capture_output=True, check_return_code=False)
-    if freeze_result and freeze_result.returncode == 0 and freeze_result.stdout:
-        requirements_content = freeze_result.stdout
-        print("Successfully retrieved package list from old Python.")
+    # pip freeze writes straight into the requirements file; the listing is never held in memory.
+    requirements_path = download_dir / f"requirements-{os.getpid()}.txt"
+    pip_freeze_cmd = [old_python_exe, *_PIP_FREEZE_ARGS]
+    freeze_ok = False
+    try:
+        download_dir.mkdir(parents=True, exist_ok=True)
+        with open(requirements_path, 'wb') as requirements_file:
+            freeze_result = system_utils.run_command(pip_freeze_cmd, check_return_code=False, stdout_file=requirements_file)
+        freeze_ok = bool(freeze_result and freeze_result.returncode == 0 and requirements_path.stat().st_size > 0)
+    except OSError as e:
+        print(f"Error: Could not write requirements file {requirements_path}: {e}", file=sys.stderr)
+    if freeze_ok:
+        print(f"Successfully saved package list from old Python to: {requirements_path}")
     else:
+        requirements_path = _discard_requirements_file(requirements_path)
         print("Warning: Could not retrieve package list from old Python.", file=sys.stderr)
         if not system_utils.prompt_user_for_confirmation("Continue upgrade without package migration?"):
             return False
 
     print("\nStep 2: Installing a new version of Python...")
+    install_started_at = time.time()
     print("It is strongly recommended to install the new Python version to a DIFFERENT directory.")
     if not install_python_interactive("latest", download_dir): 
         print("Failed to initiate new Python installation. Aborting upgrade.", file=sys.stderr)
         return False
+    _which_python.cache_clear()
     
-    print("\n--- IMPORTANT ---")
-    print("After the new Python installer finishes, please provide the path to the new python.exe")
-    print("Example: C:\\Python312\\python.exe or /usr/local/bin/python3.12")
+    print("\n--- IMPORTANT ---\n"
+          "After the new Python installer finishes, please provide the path to the new python.exe\n"
+          "Example: C:\\Python312\\python.exe or /usr/local/bin/python3.12")
     
     new_python_exe_str = ""
+    new_python_exe_info = None
+    invalid_attempts = 0
     while True: # Prompt user for the new Python path
-        new_python_exe_str = input("Enter the full path to the new python.exe (or type 'skip' to skip package migration): ").strip().replace("\"", "")
+        if invalid_attempts >= _MAX_PATH_PROMPT_ATTEMPTS:
+            print(f"No valid new Python path after {invalid_attempts} attempts. Skipping package reinstallation.", file=sys.stderr)
+            new_python_exe_str = ""
+            break
+        detected = _find_new_python_installs(install_started_at)
+        suggested_exe = next((str(exe) for exe in detected if _realpath(str(exe)) != _realpath(old_python_exe)), None)
+        if suggested_exe:
+            print(f"Detected a new Python installation at: {suggested_exe}")
+            new_python_exe_str = input("Press Enter to use it, or enter another path (or type 'skip' to skip package migration): ").strip().replace("\"", "")
+            new_python_exe_str = new_python_exe_str or suggested_exe
+        else:
+            new_python_exe_str = input("Enter the full path to the new python.exe (or type 'skip' to skip package migration): ").strip().replace("\"", "")
         if new_python_exe_str.lower() == 'skip':
-            requirements_content = None 
+            requirements_path = _discard_requirements_file(requirements_path)
             new_python_exe_str = "" 
             print("Skipping package reinstallation.")
             break
         if not new_python_exe_str: 
             if system_utils.prompt_user_for_confirmation("No path entered. Skip package reinstallation for now?"):
-                requirements_content = None 
+                requirements_path = _discard_requirements_file(requirements_path)
                 new_python_exe_str = ""
                 break
             else:
@@ -339,54 +810,50 @@ def upgrade_python_interactive(old_python_exe_str: str, download_dir: pathlib.Pa
         
         new_python_info_temp = get_python_executable_info(new_python_exe_str)
         if new_python_info_temp:
-            if pathlib.Path(new_python_info_temp['executable']).resolve() == pathlib.Path(old_python_exe).resolve():
+            if _realpath(new_python_info_temp['executable']) == _realpath(old_python_exe):
                 print("Error: The new Python path cannot be the same as the old Python path for an upgrade.", file=sys.stderr)
                 print("Please install the new Python to a separate directory, or ensure you provide the correct new path.")
+                invalid_attempts += 1
                 continue 
             print(f"New Python identified: {new_python_info_temp['version_str']} at {new_python_info_temp['executable']}")
             if not system_utils.prompt_user_for_confirmation(f"Is this correct?"):
                 continue 
+            new_python_exe_info = new_python_info_temp
             break 
         else:
             print(f"Path '{new_python_exe_str}' does not seem to be a valid Python executable. Please try again.")
+            invalid_attempts += 1
+            # The installer may still be running; don't keep serving a cached miss for a bare command name.
+            _which_python.cache_clear()
 
-    if not new_python_exe_str: 
+    if not new_python_exe_str or not new_python_exe_info: 
         print("Python upgrade process finished (new Python installed). Package migration was skipped as no new Python path was confirmed.")
-        if requirements_content:
-            print(f"Your old package list was:\n{requirements_content}")
+        if requirements_path:
+            print(f"Your old package list was saved to: {requirements_path}")
             print("You can manually reinstall them later.")
         return True 
 
-    new_python_exe_info = get_python_executable_info(new_python_exe_str)
-    if not new_python_exe_info: 
-        print(f"Critical error: Could not re-verify new Python path {new_python_exe_str}", file=sys.stderr)
-        return False
     new_python_exe = new_python_exe_info['executable']
 
     print(f"\nStep 3: Updating pip for the new Python at {new_python_exe}...")
     if not update_pip(new_python_exe):
         print("Warning: Failed to update pip for the new Python.", file=sys.stderr)
-        if requirements_content and not system_utils.prompt_user_for_confirmation("Continue with package reinstallation despite pip update failure?"):
+        if requirements_path and not system_utils.prompt_user_for_confirmation("Continue with package reinstallation despite pip update failure?"):
             return False 
 
-    if requirements_content:
+    if requirements_path:
         print(f"\nStep 4: Reinstalling packages into the new Python at {new_python_exe}...")
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt", encoding='utf-8') as tmp_req_file:
-            tmp_req_file.write(requirements_content)
-            tmp_req_file_path_str = tmp_req_file.name
+        tmp_req_file_path_str = str(requirements_path)
         print(f"Using temporary requirements file: {tmp_req_file_path_str}")
         pip_install_cmd = [new_python_exe, "-m", "pip", "install", "--no-cache-dir", "-r", tmp_req_file_path_str]
         install_result = system_utils.run_command(pip_install_cmd, display_output_live=True, check_return_code=False) 
         if install_result and install_result.returncode == 0:
             print("Successfully reinstalled packages into the new Python.")
+            _discard_requirements_file(requirements_path)
         else:
             print("Warning: Some packages may not have been reinstalled correctly.", file=sys.stderr)
             print(f"You can try again manually: \"{new_python_exe}\" -m pip install -r \"{tmp_req_file_path_str}\"")
             print(f"The requirements file is saved at: {tmp_req_file_path_str}")
-        try:
-            pathlib.Path(tmp_req_file_path_str).unlink(missing_ok=True)
-        except Exception as e_del:
-            print(f"Note: Could not delete temporary requirements file {tmp_req_file_path_str}: {e_del}", file=sys.stderr)
 
     print("\n--- Python Upgrade Process Summary ---")
     print(f"Old Python: {old_python_exe} (Version: {old_python_info['version_str']})")
@@ -394,16 +861,16 @@ def upgrade_python_interactive(old_python_exe_str: str, download_dir: pathlib.Pa
          print(f"New Python: {new_python_exe_info['executable']} (Version: {new_python_exe_info['version_str']})")
     else:
         print("New Python installation was guided, but path not confirmed for package migration or migration was skipped.")
-    if requirements_content and new_python_exe_str : print("Attempted to migrate packages.")
-    elif requirements_content and not new_python_exe_str : print("Package backup was created but migration was skipped.")
+    if requirements_path and new_python_exe_str : print("Attempted to migrate packages.")
+    elif requirements_path and not new_python_exe_str : print("Package backup was created but migration was skipped.")
     else: print("Package migration was skipped or failed at backup stage.")
         
     print("\nRecommendation: You can now uninstall the old Python version if you are satisfied with the new setup.")
     print(f"Path to old Python: {old_python_exe}")
     return True
 
+# Placeholder: should check that Python's main and Scripts directories are in PATH; the
+# installer normally handles this when 'Add Python to PATH' is checked.
 def ensure_python_in_path(python_exe_path: pathlib.Path | None = None) -> bool:
-    print(f"Placeholder: ensure_python_in_path({python_exe_path}) called.", file=sys.stderr)
-    print("Please ensure Python's Scripts directory and main directory are in your PATH.", file=sys.stderr)
-    print("This is usually handled by the Python installer if you check 'Add Python to PATH'.")
-    return False 
\ No newline at end of file
+    print(f"Placeholder: ensure_python_in_path({python_exe_path}) called. Ensure Python and its Scripts directory are in PATH.", file=sys.stderr)
+    return False
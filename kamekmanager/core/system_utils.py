@@ -5,11 +5,21 @@ import ctypes
 import pathlib
 import subprocess
 import shutil
-import zipfile
+import functools
+import time
+import hashlib
+import struct
+import codecs
+import locale
+from typing import TYPE_CHECKING
 
 from kamekmanager.common import constants 
 
+if TYPE_CHECKING:
+    import zipfile
+
 # ... (all system_utils functions from Phase 1.4 - no changes here)
+@functools.lru_cache(maxsize=1)
 def check_admin_privileges() -> bool:
     if os.name == 'nt': 
         try:
@@ -26,6 +36,7 @@ def check_admin_privileges() -> bool:
         print(f"Unsupported OS for admin check: {os.name}", file=sys.stderr)
         return False
 
+@functools.lru_cache(maxsize=None)
 def get_user_data_directory(tool_name: str = constants.APP_NAME) -> pathlib.Path:
     tool_name_fs = tool_name.replace(' ', '_') 
     if os.name == 'nt': 
@@ -49,14 +60,38 @@ def get_user_data_directory(tool_name: str = constants.APP_NAME) -> pathlib.Path
         print(f"Error creating data directory {path}: {e}", file=sys.stderr)
     return path
 
+def _spawn_kwargs(output_redirected: bool) -> dict:
+    """
+    Extra subprocess options for cheaper process creation. On POSIX, close_fds=False lets subprocess
+    use posix_spawn/vfork (our own fds are non-inheritable per PEP 446). On Windows, a command whose
+    output is fully redirected gets no console of its own.
+    """
+    if os.name == 'posix':
+        return {"close_fds": False}
+    if os.name == 'nt' and output_redirected:
+        return {"creationflags": subprocess.CREATE_NO_WINDOW}
+    return {}
+
 def run_command(
     command_parts: list[str], 
     working_directory: str | os.PathLike | None = None, 
     capture_output: bool = True, 
     check_return_code: bool = True, 
     display_output_live: bool = False,
-    env: dict | None = None 
+    env: dict | None = None,
+    stdout_file=None,
+    text: bool = True,
+    discard_output: bool = False
 ) -> subprocess.CompletedProcess | None:
+    """
+    Runs a command and returns its CompletedProcess, or None if it could not be run
+    (or failed while check_return_code is set). If stdout_file is given, the command's
+    stdout is written straight to that open file instead of being captured.
+    With text=False, captured output is returned as raw bytes for the caller to decode.
+    With discard_output=True, stdout/stderr go to DEVNULL for callers that only need the exit code.
+    With display_output_live=True, output is echoed as it arrives; if capture_output is also set, the
+    echoed text (stderr merged into stdout) is returned as stdout so callers can inspect failures.
+    """
     try:
         command_str = ' '.join(str(part) for part in command_parts)
         if display_output_live:
@@ -64,26 +99,62 @@ def run_command(
                                        cwd=working_directory,
                                        stdout=subprocess.PIPE,
                                        stderr=subprocess.STDOUT, 
-                                       text=True,
-                                       bufsize=1, 
-                                       universal_newlines=True,
-                                       env=env)
+                                       bufsize=0,
+                                       env=env,
+                                       **_spawn_kwargs(output_redirected=False))
+            output_parts = [] if capture_output else None
             if process.stdout:
-                for line in process.stdout:
-                    print(line, end='') 
+                # Relay output in blocks as it arrives rather than per line, so \r progress bars show up live.
+                # The child writes in the locale encoding; decode incrementally (a block may split a character)
+                # and let sys.stdout re-encode for the console.
+                decoder = codecs.getincrementaldecoder(locale.getpreferredencoding(False))(errors="replace")
+                for chunk in iter(functools.partial(process.stdout.read, 64 * 1024), b""):
+                    text_chunk = decoder.decode(chunk)
+                    sys.stdout.write(text_chunk)
+                    sys.stdout.flush()
+                    if output_parts is not None:
+                        output_parts.append(text_chunk)
+                text_chunk = decoder.decode(b"", final=True)
+                sys.stdout.write(text_chunk)
+                sys.stdout.flush()
+                if output_parts is not None:
+                    output_parts.append(text_chunk)
+                process.stdout.close()
             process.wait() 
             result = subprocess.CompletedProcess(args=command_parts, 
                                                 returncode=process.returncode,
-                                                stdout=None, 
+                                                stdout="".join(output_parts) if output_parts is not None else None, 
                                                 stderr=None) 
+        elif discard_output:
+            result = subprocess.run(
+                command_parts,
+                cwd=working_directory,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=False, 
+                env=env,
+                **_spawn_kwargs(output_redirected=True)
+            )
+        elif stdout_file is not None:
+            result = subprocess.run(
+                command_parts,
+                cwd=working_directory,
+                stdout=stdout_file,
+                stderr=subprocess.PIPE,
+                text=True,
+                check=False, 
+                env=env,
+                **_spawn_kwargs(output_redirected=True)
+            )
         else:
             result = subprocess.run(
                 command_parts,
                 cwd=working_directory,
                 capture_output=capture_output,
-                text=True,
+                text=text,
                 check=False, 
-                env=env
+                env=env,
+                **_spawn_kwargs(output_redirected=capture_output)
             )
 
         if check_return_code and result.returncode != 0:
@@ -101,21 +172,65 @@ def run_command(
         print(f"An error occurred while running command {command_str}: {e}", file=sys.stderr)
         return None
 
+def shell_execute(file_path: str | os.PathLike, verb: str | None = None) -> bool | None:
+    """
+    Opens a file via ShellExecuteW on Windows (verb e.g. "runas" to request elevation).
+    Returns True on success, False if ShellExecuteW ran but failed (reporting its error code),
+    and None if ShellExecuteW is unavailable (off Windows), so callers only fall back in that case.
+    """
+    if os.name != 'nt':
+        return None
+    try:
+        # Return values <= 32 are error codes (e.g. 2 = file not found, 5 = access denied / UAC declined).
+        return_code = ctypes.windll.shell32.ShellExecuteW(None, verb, str(file_path), None, None, 1)
+    except (AttributeError, OSError) as e:
+        print(f"ShellExecuteW unavailable: {e}", file=sys.stderr)
+        return None
+    if return_code <= 32:
+        print(f"ShellExecuteW failed for {file_path} (error code {return_code}).", file=sys.stderr)
+        return False
+    return True
+
+_MAX_ENVIRONMENT_VALUE_LENGTH = 32767  # includes the terminating NUL
+_LEGACY_PATH_LENGTH_LIMIT = 2047
+_SYSTEM_ENVIRONMENT_KEY = r"SYSTEM\CurrentControlSet\Control\Session Manager\Environment"
+_USER_ENVIRONMENT_KEY = "Environment"
+
+def _open_environment_key(is_system_wide: bool, access: int):
+    """Opens the persistent (registry) environment of the machine or the current user."""
+    import winreg
+    if is_system_wide:
+        return winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, _SYSTEM_ENVIRONMENT_KEY, 0, access)
+    return winreg.OpenKey(winreg.HKEY_CURRENT_USER, _USER_ENVIRONMENT_KEY, 0, access)
+
+def _broadcast_environment_change() -> None:
+    """Tells Explorer and other top-level windows to reload the environment (what setx does after writing)."""
+    HWND_BROADCAST, WM_SETTINGCHANGE, SMTO_ABORTIFHUNG = 0xFFFF, 0x001A, 0x0002
+    try:
+        result = ctypes.c_size_t()
+        ctypes.windll.user32.SendMessageTimeoutW(HWND_BROADCAST, WM_SETTINGCHANGE, 0, "Environment",
+                                                 SMTO_ABORTIFHUNG, 5000, ctypes.byref(result))
+    except (AttributeError, OSError) as e:
+        print(f"Note: Could not broadcast environment change: {e}", file=sys.stderr)
+
 def set_environment_variable(name: str, value: str, is_system_wide: bool = True) -> bool:
     if os.name == 'nt':
         if not check_admin_privileges() and is_system_wide:
             print(f"Admin privileges required to set system-wide environment variable '{name}'.", file=sys.stderr)
             return False
-        quoted_value = f'"{value}"' if " " in value else value
-        command = ['setx', name, quoted_value]
-        if is_system_wide: command.append('/M')
-        result = run_command(command, capture_output=True, check_return_code=False) 
-        if result is not None:
-            print(f"Environment variable '{name}' set. Restart shell/PC for changes.")
-            return True
-        else:
-            print(f"Failed to execute setx command for '{name}'.", file=sys.stderr)
+        # Written straight to the registry rather than via setx: no child process, no 1024-char limit.
+        import winreg
+        value_type = winreg.REG_EXPAND_SZ if "%" in value else winreg.REG_SZ
+        try:
+            with _open_environment_key(is_system_wide, winreg.KEY_SET_VALUE) as key:
+                winreg.SetValueEx(key, name, 0, value_type, value)
+        except OSError as e:
+            print(f"Failed to set environment variable '{name}': {e}", file=sys.stderr)
             return False
+        _broadcast_environment_change()
+        _clear_path_lookup_caches()
+        print(f"Environment variable '{name}' set. Restart shell/PC for changes.")
+        return True
     else:
         print(f"Persistent env var setting not supported for {os.name}. Set '{name}' to '{value}' manually.", file=sys.stderr)
         return False
@@ -123,94 +238,529 @@ def set_environment_variable(name: str, value: str, is_system_wide: bool = True)
 def get_environment_variable(name: str) -> str | None:
     return os.getenv(name)
 
+@functools.lru_cache(maxsize=4)
+def _get_path_program_index(path_value: str, pathext_value: str) -> dict[str, str]:
+    """
+    Maps each program name on PATH to its first full path, built with one os.scandir per PATH entry
+    instead of shutil.which's stat per entry and PATHEXT suffix on every lookup.
+    On Windows, names are case-folded and also indexed without their PATHEXT extension.
+    """
+    extensions = {ext.lower() for ext in pathext_value.split(os.pathsep) if ext} if os.name == 'nt' else set()
+    index = {}
+    for directory in path_value.split(os.pathsep):
+        if not directory:
+            continue
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = os.path.normcase(entry.name)
+                    index.setdefault(name, entry.path)
+                    if extensions:
+                        stem, ext = os.path.splitext(name)
+                        if ext in extensions:
+                            index.setdefault(stem, entry.path)
+        except OSError:
+            continue
+    return index
+
 def is_program_in_path(program_name: str) -> bool:
+    """
+    Looks program_name up in the PATH index, which is keyed on the current PATH/PATHEXT values,
+    so a changed PATH is picked up on the next call.
+    """
+    if os.path.dirname(program_name):
+        return shutil.which(program_name) is not None
+    index = _get_path_program_index(os.environ.get("PATH", ""), os.environ.get("PATHEXT", ""))
+    program_path = index.get(os.path.normcase(program_name))
+    if program_path is None:
+        return False
+    if os.access(program_path, os.X_OK) and not os.path.isdir(program_path):
+        return True
+    # The first name match is not runnable (e.g. a non-executable file); let which() settle it.
     return shutil.which(program_name) is not None
 
+def _clear_path_lookup_caches() -> None:
+    _get_path_program_index.cache_clear()
+
+@functools.lru_cache(maxsize=4)
+def _get_path_entry_set(path_value: str) -> frozenset[str]:
+    """Normalizes each entry of a PATH string once so membership checks are set lookups."""
+    entries = set()
+    for path_entry in path_value.split(os.pathsep):
+        if path_entry:
+            entries.add(os.path.normcase(os.path.realpath(path_entry)))
+    return frozenset(entries)
+
+def is_directory_in_path(directory: str | os.PathLike) -> bool:
+    """Checks whether a directory is listed in the current process PATH."""
+    path_value = os.getenv("PATH", "")
+    if not path_value:
+        return False
+    return os.path.normcase(os.path.realpath(directory)) in _get_path_entry_set(path_value)
+
 def add_directory_to_system_path(directory: str) -> bool:
     if os.name == 'nt':
         if not check_admin_privileges():
             print("Admin privileges required to modify system PATH.", file=sys.stderr)
             return False
+        import winreg
         norm_directory = str(pathlib.Path(directory).resolve())
         print(f"WARNING: Modifying system PATH is risky. Ensure backups.")
         print(f"Attempting to add '{norm_directory}' to system PATH.")
-        command = ['setx', 'PATH', f"%PATH%;{norm_directory}", '/M']
-        result = run_command(command, capture_output=True, check_return_code=False)
-        if result is not None:
-            print(f"Directory '{norm_directory}' command to add to PATH executed. Restart shell/PC.")
-            print("IMPORTANT: Verify PATH. `setx` can truncate it if too long.")
-            return True
-        else:
-            print(f"Failed to execute command to add '{norm_directory}' to PATH.", file=sys.stderr)
+        # Edits the machine PATH value in place. `setx PATH %PATH%;...` would instead fold the user
+        # PATH into it, flatten REG_EXPAND_SZ entries, and truncate at 1024 characters.
+        try:
+            with _open_environment_key(True, winreg.KEY_QUERY_VALUE | winreg.KEY_SET_VALUE) as key:
+                try:
+                    path_value, value_type = winreg.QueryValueEx(key, "Path")
+                except FileNotFoundError:
+                    path_value, value_type = "", winreg.REG_EXPAND_SZ
+                target = os.path.normcase(norm_directory.rstrip("\\"))
+                entries = [entry for entry in path_value.split(";") if entry]
+                if any(os.path.normcase(winreg.ExpandEnvironmentStrings(entry).rstrip("\\")) == target for entry in entries):
+                    print(f"Directory '{norm_directory}' is already in the system PATH.")
+                    return True
+                new_path_value = ";".join([*entries, norm_directory])
+                if len(new_path_value) >= _MAX_ENVIRONMENT_VALUE_LENGTH:
+                    print(f"Error: Adding '{norm_directory}' would make the system PATH longer than Windows allows "
+                          f"({_MAX_ENVIRONMENT_VALUE_LENGTH - 1} characters). PATH was not changed.", file=sys.stderr)
+                    return False
+                if len(new_path_value) > _LEGACY_PATH_LENGTH_LIMIT:
+                    print(f"Warning: The system PATH is now {len(new_path_value)} characters long; some older tools "
+                          f"only read the first {_LEGACY_PATH_LENGTH_LIMIT}.", file=sys.stderr)
+                winreg.SetValueEx(key, "Path", 0, value_type, new_path_value)
+        except OSError as e:
+            print(f"Failed to add '{norm_directory}' to PATH: {e}", file=sys.stderr)
             return False
+        _broadcast_environment_change()
+        _clear_path_lookup_caches()
+        print(f"Directory '{norm_directory}' added to system PATH. Restart shell/PC.")
+        return True
     else:
         print("Automatic PATH modification not supported for this OS.", file=sys.stderr)
         return False
 
-def download_file(url: str, destination_path: pathlib.Path, show_progress: bool = True) -> bool:
+_DOWNLOAD_BLOCK_SIZE = 1024 * 1024
+_DOWNLOAD_HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'}
+# Files smaller than this are not worth splitting into parallel range requests.
+_SEGMENTED_DOWNLOAD_MIN_SIZE = 8 * 1024 * 1024
+
+@functools.lru_cache(maxsize=1)
+def get_http_session():
+    """
+    Returns a process-wide requests.Session so connections (TCP/TLS) are pooled across calls,
+    with a small retry budget for transient connection failures.
+    Raises ImportError if 'requests' is not installed.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=Retry(total=2, backoff_factor=0.3))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({'User-Agent': f'{constants.APP_NAME}/{constants.APP_VERSION}'})
+    return session
+
+_available_urls: set[str] = set()
+
+def is_url_available(url: str, timeout: float = 5) -> bool:
+    """
+    Checks whether a URL currently serves content, using a 1-byte ranged GET rather than HEAD
+    since some servers reject HEAD. The body is never read. Only positive results are remembered,
+    so a transient failure is retried on the next call.
+    """
+    if url in _available_urls:
+        return True
+    try:
+        response = get_http_session().get(url, headers={'Range': 'bytes=0-0'}, stream=True, timeout=timeout, allow_redirects=True)
+        try:
+            available = response.status_code in (200, 206)
+        finally:
+            response.close()
+    except Exception:
+        # Missing 'requests', network errors and timeouts all mean "not available".
+        return False
+    if available:
+        _available_urls.add(url)
+    return available
+
+def find_first_available_url(urls: list[str], timeout: float = 5) -> str | None:
+    """
+    Probes candidate URLs concurrently and returns the first available one in list order,
+    so wall time is a single round trip rather than one per candidate.
+    """
+    if not urls:
+        return None
+    if len(urls) == 1:
+        return urls[0] if is_url_available(urls[0], timeout) else None
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+        availability = list(executor.map(lambda url: is_url_available(url, timeout), urls))
+    for url, available in zip(urls, availability):
+        if available:
+            return url
+    return None
+
+_created_directories: set[str] = set()
+
+def _ensure_directory(directory: pathlib.Path) -> None:
+    """mkdir -p that remembers what it already created, so repeat downloads into one folder cost no syscall."""
+    key = str(directory)
+    if key not in _created_directories:
+        directory.mkdir(parents=True, exist_ok=True)
+        _created_directories.add(key)
+
+def _preallocate_file(file_obj, size: int) -> bool:
+    """Reserves size bytes up front on POSIX so the filesystem allocates extents once, not per write."""
+    if not hasattr(os, "posix_fallocate"):
+        return False
+    try:
+        os.posix_fallocate(file_obj.fileno(), 0, size)
+        return True
+    except OSError:  # e.g. EOPNOTSUPP on some filesystems
+        return False
+
+def download_file(url: str, destination_path: pathlib.Path, show_progress: bool = True,
+                  expected_sha256: str | None = None) -> bool:
+    """
+    Streams url to destination_path. If expected_sha256 is given, the file is hashed while it is
+    written (no second read pass) and deleted again if the digest does not match.
+    """
+    opened = completed = False
     try:
         import requests 
+        import urllib3
         print(f"Downloading {url} to {destination_path}...")
-        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'}
-        response = requests.get(url, stream=True, timeout=60, headers=headers)
+        response = get_http_session().get(url, stream=True, timeout=60, headers=_DOWNLOAD_HEADERS)
         response.raise_for_status()
         total_size = int(response.headers.get('content-length', 0))
-        block_size = 8192
-        destination_path.parent.mkdir(parents=True, exist_ok=True)
+        # Read the raw stream in 1 MiB blocks; iter_content's small-chunk generator adds per-chunk overhead.
+        response.raw.decode_content = True
+        hasher = hashlib.sha256() if expected_sha256 else None
+        _ensure_directory(destination_path.parent)
         with open(destination_path, 'wb') as f:
-            if show_progress and total_size > 0:
+            opened = True
+            preallocated = total_size > 0 and _preallocate_file(f, total_size)
+            if (show_progress and total_size > 0) or hasher:
+                report_progress = show_progress and total_size > 0
                 downloaded_size = 0
-                print(f"File size: {total_size / (1024*1024):.2f} MB")
-                for chunk in response.iter_content(chunk_size=block_size):
+                if report_progress:
+                    print(f"File size: {total_size / (1024*1024):.2f} MB")
+                for chunk in iter(functools.partial(response.raw.read, _DOWNLOAD_BLOCK_SIZE), b""):
+                    if hasher:
+                        hasher.update(chunk)
                     f.write(chunk)
-                    downloaded_size += len(chunk)
-                    progress = min(int(50 * downloaded_size / total_size), 50)
-                    percentage = (downloaded_size / total_size) * 100 if total_size > 0 else 0
-                    sys.stdout.write(f"\r[{'#' * progress}{'.' * (50 - progress)}] {percentage:.2f}% ({downloaded_size // 1024}KB / {total_size // 1024}KB)")
-                    sys.stdout.flush()
-                sys.stdout.write('\n')
+                    if report_progress:
+                        downloaded_size += len(chunk)
+                        _print_download_progress(downloaded_size, total_size)
+                if report_progress:
+                    sys.stdout.write('\n')
             else:
-                for chunk in response.iter_content(chunk_size=block_size):
-                    f.write(chunk)
+                # No progress to report: let copyfileobj run the read/write loop.
+                shutil.copyfileobj(response.raw, f, _DOWNLOAD_BLOCK_SIZE)
+            if preallocated:
+                # Content-Length counts encoded bytes; drop any preallocated tail the decoded body didn't fill.
+                f.truncate()
+        if hasher and hasher.hexdigest() != expected_sha256.lower():
+            print(f"Checksum mismatch for {destination_path}: expected {expected_sha256.lower()}, got {hasher.hexdigest()}", file=sys.stderr)
+            return False
+        completed = True
         print(f"Download complete: {destination_path}")
         return True
     except ImportError:
         print("The 'requests' library is required. `pip install requests`.", file=sys.stderr)
         return False
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as e:
+        # Reading response.raw directly surfaces urllib3 errors (e.g. ProtocolError on a dropped
+        # connection) that iter_content would have wrapped in a RequestException.
         print(f"Error downloading {url}: {e}", file=sys.stderr)
-        if destination_path.exists():
-            try: destination_path.unlink()
-            except OSError: pass
         return False
     except Exception as e:
         print(f"An unexpected error during download of {url}: {e}", file=sys.stderr)
         return False
+    finally:
+        # Any failure after the file was opened (including KeyboardInterrupt) leaves a partial file
+        # that preallocation may have padded to the full Content-Length; never leave it behind.
+        if opened and not completed:
+            _remove_partial_download(destination_path)
+
+def _remove_partial_download(destination_path: pathlib.Path) -> None:
+    try:
+        destination_path.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+_PROGRESS_REDRAW_INTERVAL = 0.1
+_last_progress_draw = 0.0
+
+def _print_download_progress(downloaded_size: int, total_size: int) -> None:
+    """Redraws the progress bar at most ~10 times a second (always for the final update)."""
+    global _last_progress_draw
+    now = time.monotonic()
+    if downloaded_size < total_size and now - _last_progress_draw < _PROGRESS_REDRAW_INTERVAL:
+        return
+    _last_progress_draw = now
+    progress = min(int(50 * downloaded_size / total_size), 50)
+    percentage = (downloaded_size / total_size) * 100 if total_size > 0 else 0
+    sys.stdout.write(f"\r[{'#' * progress}{'.' * (50 - progress)}] {percentage:.2f}% ({downloaded_size // 1024}KB / {total_size // 1024}KB)")
+    sys.stdout.flush()
+
+def download_file_segmented(url: str, destination_path: pathlib.Path, segments: int = 4, show_progress: bool = True) -> bool:
+    """
+    Downloads a large file as several parallel HTTP Range requests written into a preallocated file.
+    Falls back to download_file() when the server does not advertise byte ranges, the file is small,
+    or any segment fails.
+    """
+    try:
+        session = get_http_session()
+        head_response = session.head(url, allow_redirects=True, timeout=15, headers=_DOWNLOAD_HEADERS)
+        total_size = int(head_response.headers.get('content-length', 0))
+        accepts_ranges = head_response.headers.get('accept-ranges', '').lower() == 'bytes'
+        final_url = head_response.url or url
+    except Exception:
+        return download_file(url, destination_path, show_progress)
+    if not head_response.ok or not accepts_ranges or total_size < _SEGMENTED_DOWNLOAD_MIN_SIZE:
+        return download_file(url, destination_path, show_progress)
+
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    segment_size = -(-total_size // segments)
+    byte_ranges = [(start, min(start + segment_size, total_size) - 1) for start in range(0, total_size, segment_size)]
+    progress_lock = threading.Lock()
+    downloaded = [0]
+
+    def fetch_segment(byte_range: tuple[int, int]) -> bool:
+        start, end = byte_range
+        headers = {**_DOWNLOAD_HEADERS, 'Range': f'bytes={start}-{end}'}
+        with session.get(final_url, headers=headers, stream=True, timeout=60) as response:
+            if response.status_code != 206:
+                return False
+            written = 0
+            with open(destination_path, 'r+b') as f:
+                f.seek(start)
+                for chunk in iter(functools.partial(response.raw.read, _DOWNLOAD_BLOCK_SIZE), b""):
+                    f.write(chunk)
+                    written += len(chunk)
+                    if show_progress:
+                        with progress_lock:
+                            downloaded[0] += len(chunk)
+                            _print_download_progress(downloaded[0], total_size)
+            return written == end - start + 1
+
+    print(f"Downloading {url} to {destination_path} in {len(byte_ranges)} segments...")
+    if show_progress:
+        print(f"File size: {total_size / (1024*1024):.2f} MB")
+    opened = all_ok = False
+    try:
+        _ensure_directory(destination_path.parent)
+        with open(destination_path, 'wb') as f:
+            opened = True
+            f.truncate(total_size)
+        with ThreadPoolExecutor(max_workers=len(byte_ranges)) as executor:
+            all_ok = all(executor.map(fetch_segment, byte_ranges))
+    except Exception as e:
+        print(f"\nSegmented download of {url} failed: {e}", file=sys.stderr)
+    finally:
+        # The file was preallocated to its full size, zero-filled; never leave it behind on any
+        # failure (including KeyboardInterrupt), since it would look like a complete installer.
+        if opened and not all_ok:
+            _remove_partial_download(destination_path)
+    if show_progress:
+        sys.stdout.write('\n')
+    if all_ok:
+        print(f"Download complete: {destination_path}")
+        return True
+
+    print("Segmented download failed; retrying as a single stream.", file=sys.stderr)
+    return download_file(url, destination_path, show_progress)
+
+_PARALLEL_EXTRACT_MIN_MEMBERS = 64
+
+def _get_zip_member_target(member_name: str, extract_to_dir: pathlib.Path) -> pathlib.Path | None:
+    """
+    Maps an archive member to its destination the way zipfile.extract() does: the drive and any
+    empty, '.' or '..' parts are dropped, so the result always stays inside extract_to_dir.
+    Returns None if nothing is left of the name.
+    """
+    arcname = os.path.splitdrive(member_name.replace('/', os.sep))[1]
+    parts = [part for part in arcname.split(os.sep) if part not in ('', os.curdir, os.pardir)]
+    return extract_to_dir.joinpath(*parts) if parts else None
+
+# Stored (uncompressed) members at least this large are copied in-kernel where the OS allows it.
+_ZERO_COPY_MIN_SIZE = 1024 * 1024
+_ZERO_COPY_AVAILABLE = hasattr(os, "copy_file_range") or sys.platform.startswith("linux")
+_ZIP_LOCAL_HEADER = struct.Struct("<4s22xHH")  # signature, (fixed fields), name length, extra length
+
+def _copy_stored_zip_member(zip_fd: int, member: "zipfile.ZipInfo", target: pathlib.Path) -> bool:
+    """
+    Copies a stored member's bytes straight from the archive to target with copy_file_range/sendfile,
+    so the data never passes through Python. The CRC is still checked (over an mmap of the result).
+    Returns False if the fast path cannot be used; the caller then extracts the member normally.
+    """
+    import mmap
+    import zlib
+    try:
+        signature, name_length, extra_length = _ZIP_LOCAL_HEADER.unpack(
+            os.pread(zip_fd, _ZIP_LOCAL_HEADER.size, member.header_offset))
+        if signature != b"PK\x03\x04":
+            return False
+        offset = member.header_offset + _ZIP_LOCAL_HEADER.size + name_length + extra_length
+        remaining = member.file_size
+        with open(target, 'wb') as destination:
+            destination_fd = destination.fileno()
+            while remaining:
+                if hasattr(os, "copy_file_range"):
+                    copied = os.copy_file_range(zip_fd, destination_fd, remaining, offset)
+                else:
+                    copied = os.sendfile(destination_fd, zip_fd, offset, remaining)
+                if not copied:
+                    return False
+                offset += copied
+                remaining -= copied
+        with open(target, 'rb') as written, mmap.mmap(written.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            return zlib.crc32(view) == member.CRC
+    except OSError:
+        return False
+
+def _extract_open_zip_members(raw_zip, zip_ref: "zipfile.ZipFile", file_targets: list) -> None:
+    """
+    Streams (member, target) pairs out of an already open archive in 1 MiB blocks rather than
+    extract()'s 8 KiB copy loop. raw_zip is the file object zip_ref was opened on.
+    """
+    import zipfile
+    for member, target in file_targets:
+        copied_in_kernel = (_ZERO_COPY_AVAILABLE
+                            and member.compress_type == zipfile.ZIP_STORED
+                            and not member.flag_bits & 0x1  # encrypted
+                            and member.file_size >= _ZERO_COPY_MIN_SIZE
+                            and _copy_stored_zip_member(raw_zip.fileno(), member, target))
+        if not copied_in_kernel:
+            with zip_ref.open(member) as source, open(target, 'wb') as destination:
+                shutil.copyfileobj(source, destination, _DOWNLOAD_BLOCK_SIZE)
+        # extractall() drops Unix permission bits; keep them so extracted tools stay executable.
+        unix_mode = (member.external_attr >> 16) & 0o777
+        if unix_mode and os.name == 'posix':
+            os.chmod(target, unix_mode)
+
+def _extract_zip_members(zip_path: pathlib.Path, file_targets: list) -> None:
+    """Thread-pool worker for extract_zip: ZipFile objects are not thread-safe, so each worker opens its own."""
+    import zipfile
+    with open(zip_path, 'rb', buffering=_DOWNLOAD_BLOCK_SIZE) as raw_zip, zipfile.ZipFile(raw_zip, 'r') as zip_ref:
+        _extract_open_zip_members(raw_zip, zip_ref, file_targets)
+
+@functools.lru_cache(maxsize=1)
+def _get_libarchive():
+    """Imports the optional 'libarchive' (python-libarchive-c) binding on first use, or returns None."""
+    try:
+        import libarchive
+        return libarchive
+    except (ImportError, OSError):  # OSError: binding installed but the libarchive C library is missing
+        return None
+
+def _extract_zip_with_libarchive(libarchive, zip_path: pathlib.Path, extract_to_dir: pathlib.Path) -> bool:
+    """
+    Extracts through libarchive's C reader, for archives using compression methods zipfile cannot decode.
+    Output matches the zipfile path: names are sanitized the same way and symlink entries are written
+    as regular files holding the link target. Returns False if libarchive fails.
+    """
+    created_directories = {extract_to_dir}
+    try:
+        with libarchive.file_reader(str(zip_path)) as archive:
+            for entry in archive:
+                target = _get_zip_member_target(entry.pathname, extract_to_dir)
+                if target is None:
+                    continue
+                if entry.isdir:
+                    if target not in created_directories:
+                        target.mkdir(parents=True, exist_ok=True)
+                        created_directories.add(target)
+                    continue
+                if not (entry.isfile or entry.issym):
+                    continue
+                if target.parent not in created_directories:
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    created_directories.add(target.parent)
+                with open(target, 'wb') as f:
+                    if entry.issym:
+                        # A zip symlink member's data is its target path; zipfile writes that out as-is.
+                        f.write(os.fsencode(entry.linkpath))
+                    else:
+                        for block in entry.get_blocks():
+                            f.write(block)
+                # Archives written on Windows often carry no permission bits; keep the default mode then.
+                permissions = entry.mode & 0o777
+                if permissions and os.name == 'posix':
+                    os.chmod(target, permissions)
+        return True
+    except Exception as e:
+        print(f"libarchive extraction failed ({e}); falling back to zipfile.", file=sys.stderr)
+        return False
+
+# Compression methods zipfile can decode (ZIP_STORED, ZIP_DEFLATED, ZIP_BZIP2, ZIP_LZMA).
+_ZIPFILE_COMPRESSION_METHODS = frozenset({0, 8, 12, 14})
 
 def extract_zip(zip_path: pathlib.Path, extract_to_dir: pathlib.Path) -> bool:
+    # zipfile (and its zlib/bz2/lzma support) is only imported by callers that actually extract.
+    import zipfile
     try:
         if not zip_path.exists():
             print(f"ZIP file not found: {zip_path}", file=sys.stderr)
             return False
-        if not zipfile.is_zipfile(zip_path):
-            print(f"File is not a valid ZIP archive: {zip_path}", file=sys.stderr)
-            return False
-        extract_to_dir.mkdir(parents=True, exist_ok=True)
-        print(f"Extracting {zip_path.name} to {extract_to_dir}...")
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            zip_ref.extractall(extract_to_dir)
+        # Opening the archive validates it (BadZipFile below), so no separate is_zipfile() pass
+        # re-reads the central directory. The serial path extracts through this same handle.
+        with open(zip_path, 'rb', buffering=_DOWNLOAD_BLOCK_SIZE) as zip_file, zipfile.ZipFile(zip_file, 'r') as zip_ref:
+            members = zip_ref.infolist()
+            extract_to_dir.mkdir(parents=True, exist_ok=True)
+            print(f"Extracting {zip_path.name} to {extract_to_dir}...")
+            if any(member.compress_type not in _ZIPFILE_COMPRESSION_METHODS for member in members):
+                # zipfile cannot decode e.g. Deflate64 members; libarchive can, if it is installed.
+                libarchive = _get_libarchive()
+                if libarchive is not None and _extract_zip_with_libarchive(libarchive, zip_path, extract_to_dir):
+                    print("Extraction complete.")
+                    return True
+            # Create every directory once up front (extractall re-checks and mkdirs per member);
+            # this also keeps the extraction workers from racing on shared parents.
+            directories = set()
+            file_targets = []
+            for member in members:
+                target = _get_zip_member_target(member.filename, extract_to_dir)
+                if target is None:
+                    continue
+                if member.is_dir():
+                    directories.add(target)
+                else:
+                    directories.add(target.parent)
+                    file_targets.append((member, target))
+            for directory in sorted(directories):
+                directory.mkdir(parents=True, exist_ok=True)
+
+            workers = min(os.cpu_count() or 1, 8)
+            if workers < 2 or len(file_targets) < _PARALLEL_EXTRACT_MIN_MEMBERS:
+                _extract_open_zip_members(zip_file, zip_ref, file_targets)
+            else:
+                # zlib releases the GIL while inflating, so threads decompress members in parallel.
+                # ZipFile objects are not safe to share between threads; each worker opens its own.
+                from concurrent.futures import ThreadPoolExecutor
+                shares = [file_targets[i::workers] for i in range(workers)]
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    list(executor.map(lambda share: _extract_zip_members(zip_path, share), shares))
         print("Extraction complete.")
         return True
     except zipfile.BadZipFile:
-        print(f"Error: Invalid or corrupted ZIP file: {zip_path}", file=sys.stderr)
+        print(f"Error: Not a valid ZIP archive, or the file is corrupted: {zip_path}", file=sys.stderr)
         return False
     except Exception as e:
         print(f"Error extracting ZIP file {zip_path}: {e}", file=sys.stderr)
         return False
 
+_YES_REPLIES = frozenset({'y', 'yes'})
+_NO_REPLIES = frozenset({'n', 'no'})
+
 def prompt_user_for_confirmation(message: str) -> bool:
     while True:
-        reply = input(f"{message} (y/n): ").lower().strip()
-        if reply in ['y', 'yes']: return True
-        if reply in ['n', 'no']: return False
+        reply = input(f"{message} (y/n): ").strip().lower()
+        if reply in _YES_REPLIES: return True
+        if reply in _NO_REPLIES: return False
         print("Invalid input. Please enter 'y' or 'n'.")
\ No newline at end of file
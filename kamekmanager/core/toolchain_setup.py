@@ -90,15 +90,7 @@ def check_devkitpro_installation() -> dict | None:
 
     # Check if the msys2/usr/bin (which contains compilers) is in PATH
     msys2_bin_path = actual_devkitpro_path / "msys2" / "usr" / "bin"
-    msys2_bin_in_path = False
-    system_path_var = os.getenv("PATH", "")
-    if system_path_var:
-        # Normalize paths for comparison
-        normalized_msys2_bin_path = str(msys2_bin_path.resolve()).lower()
-        for path_entry in system_path_var.split(os.pathsep):
-            if str(pathlib.Path(path_entry).resolve()).lower() == normalized_msys2_bin_path:
-                msys2_bin_in_path = True
-                break
+    msys2_bin_in_path = system_utils.is_directory_in_path(msys2_bin_path)
     
     # Check DEVKITPPC environment variable consistency
     devkitppc_env_val = system_utils.get_environment_variable("DEVKITPPC")
@@ -38,7 +38,7 @@ def main():
         nargs='*', 
         default=None, 
         metavar="PACKAGE_NAME",
-        help=f"Check and install pip packages for current Python. Defaults to: {constants.PIP_PACKAGES}"
+        help=f"Check and install pip packages for current Python. Defaults to: {', '.join(constants.PIP_PACKAGES)}"
     )
     python_group.add_argument(
         "--get-latest-python-url",